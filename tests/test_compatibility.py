@@ -1,5 +1,3 @@
-import pytest
-
 from asgiref.compatibility import double_to_single_callable, is_double_callable
 from asgiref.testing import ApplicationCommunicator
 
@@ -84,7 +82,6 @@ def test_double_to_single_signature():
     )
 
 
-@pytest.mark.asyncio
 async def test_double_to_single_communicator():
     """
     Test that the new application works
@@ -7,7 +7,6 @@ from asgiref.local import Local
 from asgiref.sync import async_to_sync, sync_to_async
 
 
-@pytest.mark.asyncio
 async def test_local_task():
     """
     Tests that local works just inside a normal task context
@@ -125,7 +124,6 @@ def test_local_cycle():
     assert matched == 0
 
 
-@pytest.mark.asyncio
 async def test_local_task_to_sync():
     """
     Tests that local carries through sync_to_async
@@ -162,7 +160,6 @@ def test_local_thread_to_async():
     assert test_local.foo == "inside"
 
 
-@pytest.mark.asyncio
 async def test_local_task_to_sync_to_task():
     """
     Tests that local carries through sync_to_async and then back through
@@ -185,7 +182,6 @@ async def test_local_task_to_sync_to_task():
     assert test_local.foo == "dragons"
 
 
-@pytest.mark.asyncio
 async def test_local_many_layers():
     """
     Tests that local carries through a lot of layers of sync/async
@@ -213,7 +209,6 @@ async def test_local_many_layers():
     assert test_local.foo == "miracles"
 
 
-@pytest.mark.asyncio
 async def test_local_critical_no_task_to_thread():
     """
     Tests that local doesn't go through sync_to_async when the local is set
@@ -256,7 +251,6 @@ def test_local_critical_no_thread_to_task():
     assert test_local.foo == 89
 
 
-@pytest.mark.asyncio
 async def test_local_threads_and_tasks():
     """
     Tests that local and threads don't interfere with each other.
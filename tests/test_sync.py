@@ -1,6 +1,7 @@
 import asyncio
 import functools
 import multiprocessing
+import sys
 import threading
 import time
 import warnings
@@ -18,42 +19,66 @@ from asgiref.sync import (
 )
 from asgiref.timeout import timeout
 
+# Sleep used to prove a worker actually did some work; kept short so the
+# suite isn't gated on literal wall-clock sleeps.
+SLEEP = 0.05
 
-@pytest.mark.asyncio
-async def test_sync_to_async():
+
+@pytest.fixture(scope="module")
+def shared_executor():
+    """
+    Single-worker executor shared by the tests in this module, so each one
+    doesn't pay to spin up its own threads.
+    """
+    executor = ThreadPoolExecutor(max_workers=1)
+    yield executor
+    executor.shutdown(wait=False)
+
+
+# Helpers shared between tests, defined at module level so each test run
+# reuses the same code objects and wrapper instances rather than rebuilding
+# them as closures.
+def _sleep_and_return(value):
+    time.sleep(SLEEP)
+    return value
+
+
+def _store_thread(result):
+    result["thread"] = threading.current_thread()
+
+
+def _store_thread2(result):
+    result["thread2"] = threading.current_thread()
+
+
+_store_thread_async = sync_to_async(_store_thread)
+_store_thread2_async = sync_to_async(_store_thread2)
+
+
+async def test_sync_to_async(shared_executor):
     """
     Tests we can call sync functions from an async thread
     (even if the number of thread workers is less than the number of calls)
     """
-    # Define sync function
-    def sync_function():
-        time.sleep(1)
-        return 42
-
     # Ensure outermost detection works
     # Wrap it
-    async_function = sync_to_async(sync_function)
+    async_function = sync_to_async(functools.partial(_sleep_and_return, 42))
     # Check it works right
     start = time.monotonic()
     result = await async_function()
     end = time.monotonic()
     assert result == 42
-    assert end - start >= 1
+    assert end - start >= SLEEP
     # Set workers to 1, call it twice and make sure that works right
     loop = asyncio.get_running_loop()
     old_executor = loop._default_executor or ThreadPoolExecutor()
-    loop.set_default_executor(ThreadPoolExecutor(max_workers=1))
+    loop.set_default_executor(shared_executor)
     try:
         start = time.monotonic()
-        await asyncio.wait(
-            [
-                asyncio.create_task(async_function()),
-                asyncio.create_task(async_function()),
-            ]
-        )
+        await asyncio.gather(async_function(), async_function())
         end = time.monotonic()
-        # It should take at least 2 seconds as there's only one worker.
-        assert end - start >= 2
+        # It should take at least twice the sleep as there's only one worker.
+        assert end - start >= 2 * SLEEP
     finally:
         loop.set_default_executor(old_executor)
 
@@ -70,7 +95,6 @@ def test_sync_to_async_fail_non_function():
     )
 
 
-@pytest.mark.asyncio
 async def test_sync_to_async_fail_async():
     """
     sync_to_async raises a TypeError when applied to a sync function.
@@ -86,7 +110,6 @@ async def test_sync_to_async_fail_async():
     )
 
 
-@pytest.mark.asyncio
 async def test_async_to_sync_fail_partial():
     """
     sync_to_async raises a TypeError when applied to a sync partial.
@@ -104,7 +127,6 @@ async def test_async_to_sync_fail_partial():
     )
 
 
-@pytest.mark.asyncio
 async def test_sync_to_async_raises_typeerror_for_async_callable_instance():
     class CallableClass:
         async def __call__(self):
@@ -116,7 +138,6 @@ async def test_sync_to_async_raises_typeerror_for_async_callable_instance():
         sync_to_async(CallableClass())
 
 
-@pytest.mark.asyncio
 async def test_sync_to_async_decorator():
     """
     Tests sync_to_async as a decorator
@@ -124,7 +145,7 @@ async def test_sync_to_async_decorator():
     # Define sync function
     @sync_to_async
     def test_function():
-        time.sleep(1)
+        time.sleep(SLEEP)
         return 43
 
     # Check it works right
@@ -132,7 +153,6 @@ async def test_sync_to_async_decorator():
     assert result == 43
 
 
-@pytest.mark.asyncio
 async def test_nested_sync_to_async_retains_wrapped_function_attributes():
     """
     Tests that attributes of functions wrapped by sync_to_async are retained
@@ -155,7 +175,6 @@ async def test_nested_sync_to_async_retains_wrapped_function_attributes():
     assert test_function.__name__ == "test_function"
 
 
-@pytest.mark.asyncio
 async def test_sync_to_async_method_decorator():
     """
     Tests sync_to_async as a method decorator
@@ -164,7 +183,7 @@ async def test_sync_to_async_method_decorator():
     class TestClass:
         @sync_to_async
         def test_method(self):
-            time.sleep(1)
+            time.sleep(SLEEP)
             return 44
 
     # Check it works right
@@ -173,7 +192,6 @@ async def test_sync_to_async_method_decorator():
     assert result == 44
 
 
-@pytest.mark.asyncio
 async def test_sync_to_async_method_self_attribute():
     """
     Tests sync_to_async on a method copies __self__
@@ -182,7 +200,6 @@ async def test_sync_to_async_method_self_attribute():
     # Define sync function
     class TestClass:
         def test_method(self):
-            time.sleep(0.1)
             return 45
 
     # Check it works right
@@ -195,7 +212,16 @@ async def test_sync_to_async_method_self_attribute():
     assert method.__self__ == instance
 
 
-@pytest.mark.asyncio
+async def _async_capture_thread(result):
+    result["worked"] = True
+    result["thread"] = threading.current_thread()
+    return 65
+
+
+def _sync_capture_thread(result):
+    return async_to_sync(_async_capture_thread)(result)
+
+
 async def test_async_to_sync_to_async():
     """
     Tests we can call async functions from a sync thread created by async_to_sync
@@ -203,18 +229,8 @@ async def test_async_to_sync_to_async():
     """
     result = {}
 
-    # Define async function
-    async def inner_async_function():
-        result["worked"] = True
-        result["thread"] = threading.current_thread()
-        return 65
-
-    # Define sync function
-    def sync_function():
-        return async_to_sync(inner_async_function)()
-
     # Wrap it
-    async_function = sync_to_async(sync_function)
+    async_function = sync_to_async(functools.partial(_sync_capture_thread, result))
     # Check it works right
     number = await async_function()
     assert number == 65
@@ -309,7 +325,6 @@ def test_async_to_sync_method_decorator():
     assert result["worked"]
 
 
-@pytest.mark.asyncio
 async def test_async_to_sync_in_async():
     """
     Makes sure async_to_sync bails if you try to call it from an async loop
@@ -426,6 +441,13 @@ def test_async_to_sync_method_self_attribute():
     assert sync_function.__self__ is instance
 
 
+# Middle async function storing both threads via the inner sync helpers
+@async_to_sync
+async def _middle_store_threads(result):
+    await _store_thread_async(result)
+    await asyncio.create_task(_store_thread2_async(result))
+
+
 def test_thread_sensitive_outside_sync():
     """
     Tests that thread_sensitive SyncToAsync where the outside is sync code runs
@@ -434,28 +456,24 @@ def test_thread_sensitive_outside_sync():
 
     result = {}
 
-    # Middle async function
-    @async_to_sync
-    async def middle():
-        await inner()
-        await asyncio.create_task(inner_task())
-
-    # Inner sync functions
-    @sync_to_async
-    def inner():
-        result["thread"] = threading.current_thread()
-
-    @sync_to_async
-    def inner_task():
-        result["thread2"] = threading.current_thread()
-
     # Run it
-    middle()
+    _middle_store_threads(result)
     assert result["thread"] == threading.current_thread()
     assert result["thread2"] == threading.current_thread()
 
 
-@pytest.mark.asyncio
+# Middle async function; wrapped with async_to_sync at call time, as
+# AsyncToSync binds the caller's event loop when it is constructed.
+async def _middle_store_thread(result):
+    await _store_thread_async(result)
+
+
+# Outer sync function
+@sync_to_async
+def _outer_store_thread(result):
+    async_to_sync(_middle_store_thread)(result)
+
+
 async def test_thread_sensitive_outside_async():
     """
     Tests that thread_sensitive SyncToAsync where the outside is async code runs
@@ -465,49 +483,23 @@ async def test_thread_sensitive_outside_async():
     result_1 = {}
     result_2 = {}
 
-    # Outer sync function
-    @sync_to_async
-    def outer(result):
-        middle(result)
-
-    # Middle async function
-    @async_to_sync
-    async def middle(result):
-        await inner(result)
-
-    # Inner sync function
-    @sync_to_async
-    def inner(result):
-        result["thread"] = threading.current_thread()
-
     # Run it (in supposed parallel!)
-    await asyncio.wait(
-        [asyncio.create_task(outer(result_1)), asyncio.create_task(inner(result_2))]
-    )
+    await asyncio.gather(_outer_store_thread(result_1), _store_thread_async(result_2))
 
     # They should not have run in the main thread, but in the same thread
     assert result_1["thread"] != threading.current_thread()
     assert result_1["thread"] == result_2["thread"]
 
 
-@pytest.mark.asyncio
 async def test_thread_sensitive_with_context_matches():
     result_1 = {}
     result_2 = {}
 
-    def store_thread(result):
-        result["thread"] = threading.current_thread()
-
-    store_thread_async = sync_to_async(store_thread)
-
     async def fn():
         async with ThreadSensitiveContext():
             # Run it (in supposed parallel!)
-            await asyncio.wait(
-                [
-                    asyncio.create_task(store_thread_async(result_1)),
-                    asyncio.create_task(store_thread_async(result_2)),
-                ]
+            await asyncio.gather(
+                _store_thread_async(result_1), _store_thread_async(result_2)
             )
 
     await fn()
@@ -517,31 +509,46 @@ async def test_thread_sensitive_with_context_matches():
     assert result_1["thread"] == result_2["thread"]
 
 
-@pytest.mark.asyncio
 async def test_thread_sensitive_nested_context():
     result_1 = {}
     result_2 = {}
 
-    @sync_to_async
-    def store_thread(result):
-        result["thread"] = threading.current_thread()
-
     async with ThreadSensitiveContext():
-        await store_thread(result_1)
+        await _store_thread_async(result_1)
         async with ThreadSensitiveContext():
-            await store_thread(result_2)
+            await _store_thread_async(result_2)
 
     # They should not have run in the main thread, and on the same threads
     assert result_1["thread"] != threading.current_thread()
     assert result_1["thread"] == result_2["thread"]
 
 
-@pytest.mark.asyncio
 async def test_thread_sensitive_context_without_sync_work():
     async with ThreadSensitiveContext():
         pass
 
 
+# Double-nested wrapper chains for the tests below, built once at module
+# level; the SyncToAsync/AsyncToSync instances are reusable between calls.
+
+# Async level 1
+@async_to_sync
+async def _level1_sync(result):
+    await _level2_sync(result)
+
+
+# Sync level 2
+@sync_to_async
+def _level2_sync(result):
+    _level3_sync(result)
+
+
+# Async level 3
+@async_to_sync
+async def _level3_sync(result):
+    await _store_thread_async(result)
+
+
 def test_thread_sensitive_double_nested_sync():
     """
     Tests that thread_sensitive SyncToAsync nests inside itself where the
@@ -550,32 +557,33 @@ def test_thread_sensitive_double_nested_sync():
 
     result = {}
 
-    # Async level 1
-    @async_to_sync
-    async def level1():
-        await level2()
+    # Run it
+    _level1_sync(result)
+    assert result["thread"] == threading.current_thread()
 
-    # Sync level 2
-    @sync_to_async
-    def level2():
-        level3()
 
-    # Async level 3
-    @async_to_sync
-    async def level3():
-        await level4()
+# Sync level 1
+@sync_to_async
+def _level1_async(result):
+    async_to_sync(_level2_async)(result)
 
-    # Sync level 2
-    @sync_to_async
-    def level4():
-        result["thread"] = threading.current_thread()
 
-    # Run it
-    level1()
-    assert result["thread"] == threading.current_thread()
+# Async level 2; wrapped at call time so it rebinds to the caller's loop
+async def _level2_async(result):
+    await _level3_async(result)
+
+
+# Sync level 3
+@sync_to_async
+def _level3_async(result):
+    async_to_sync(_level4_async)(result)
+
+
+# Async level 4
+async def _level4_async(result):
+    result["thread"] = threading.current_thread()
 
 
-@pytest.mark.asyncio
 async def test_thread_sensitive_double_nested_async():
     """
     Tests that thread_sensitive SyncToAsync nests inside itself where the
@@ -584,28 +592,8 @@ async def test_thread_sensitive_double_nested_async():
 
     result = {}
 
-    # Sync level 1
-    @sync_to_async
-    def level1():
-        level2()
-
-    # Async level 2
-    @async_to_sync
-    async def level2():
-        await level3()
-
-    # Sync level 3
-    @sync_to_async
-    def level3():
-        level4()
-
-    # Async level 4
-    @async_to_sync
-    async def level4():
-        result["thread"] = threading.current_thread()
-
     # Run it
-    await level1()
+    await _level1_async(result)
     assert result["thread"] == threading.current_thread()
 
 
@@ -665,8 +653,11 @@ def sync_process(queue):
 
 def fork_first():
     """Forks process before running sync_process"""
-    queue = multiprocessing.Queue()
-    fork = multiprocessing.Process(target=sync_process, args=[queue])
+    # Use an explicit fork context so the child shares the already-imported
+    # modules rather than re-importing everything under spawn.
+    ctx = multiprocessing.get_context("fork")
+    queue = ctx.Queue()
+    fork = ctx.Process(target=sync_process, args=[queue])
     fork.start()
     fork.join(3)
     # Force cleanup in failed test case
@@ -675,7 +666,7 @@ def fork_first():
     return queue.get(True, 1)
 
 
-@pytest.mark.asyncio
+@pytest.mark.skipif(sys.platform == "win32", reason="Windows has no fork")
 async def test_multiprocessing():
     """
     Tests that a forked process can use async_to_sync without it looking for
@@ -684,15 +675,14 @@ async def test_multiprocessing():
     assert await sync_to_async(fork_first)() == 42
 
 
-@pytest.mark.asyncio
-async def test_sync_to_async_uses_executor():
+async def test_sync_to_async_uses_executor(shared_executor):
     """
     Tests that SyncToAsync uses the passed in executor correctly.
     """
 
     class CustomExecutor:
-        def __init__(self):
-            self.executor = ThreadPoolExecutor(max_workers=1)
+        def __init__(self, executor):
+            self.executor = executor
             self.times_submit_called = 0
 
         def submit(self, callable_, *args, **kwargs):
@@ -704,7 +694,7 @@ async def test_sync_to_async_uses_executor():
     def sync_func():
         return expected_result
 
-    custom_executor = CustomExecutor()
+    custom_executor = CustomExecutor(shared_executor)
     async_function = sync_to_async(
         sync_func, thread_sensitive=False, executor=custom_executor
     )
@@ -766,7 +756,6 @@ def test_sync_to_async_deadlock_ignored_with_exception():
     asyncio.run(server_entry())
 
 
-@pytest.mark.asyncio
 @pytest.mark.xfail
 async def test_sync_to_async_with_blocker_thread_sensitive():
     """
@@ -803,7 +792,6 @@ async def test_sync_to_async_with_blocker_thread_sensitive():
         await trigger_task
 
 
-@pytest.mark.asyncio
 async def test_sync_to_async_with_blocker_non_thread_sensitive():
     """
     Tests sync_to_async running on a long-time blocker in a non_thread_sensitive context.
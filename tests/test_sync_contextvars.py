@@ -3,14 +3,11 @@ import contextvars
 import threading
 import time
 
-import pytest
-
 from asgiref.sync import ThreadSensitiveContext, async_to_sync, sync_to_async
 
 foo: "contextvars.ContextVar[str]" = contextvars.ContextVar("foo")
 
 
-@pytest.mark.asyncio
 async def test_thread_sensitive_with_context_different():
     result_1 = {}
     result_2 = {}
@@ -33,7 +30,6 @@ async def test_thread_sensitive_with_context_different():
     assert result_1["thread"] != result_2["thread"]
 
 
-@pytest.mark.asyncio
 async def test_sync_to_async_contextvars():
     """
     Tests to make sure that contextvars from the calling context are
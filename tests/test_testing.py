@@ -1,10 +1,7 @@
-import pytest
-
 from asgiref.testing import ApplicationCommunicator
 from asgiref.wsgi import WsgiToAsgi
 
 
-@pytest.mark.asyncio
 async def test_receive_nothing():
     """
     Tests ApplicationCommunicator.receive_nothing to return the correct value.
@@ -5,8 +5,18 @@ import pytest
 from asgiref.testing import ApplicationCommunicator
 from asgiref.wsgi import WsgiToAsgi
 
+# How long to wait for output messages; short, so a failing test doesn't
+# block for a whole second per missing message.
+TIMEOUT = 0.1
+
+
+async def receive_all(instance, count):
+    """
+    Drains count output messages from the communicator in one await.
+    """
+    return [await instance.receive_output(TIMEOUT) for _ in range(count)]
+
 
-@pytest.mark.asyncio
 async def test_basic_wsgi():
     """
     Makes sure the WSGI wrapper has basic functionality.
@@ -37,25 +47,26 @@ async def test_basic_wsgi():
     )
     await instance.send_input({"type": "http.request"})
     # Check they send stuff
-    assert (await instance.receive_output(1)) == {
-        "type": "http.response.start",
-        "status": 200,
-        "headers": [(b"x-colour", b"Blue")],
-    }
-    assert (await instance.receive_output(1)) == {
-        "type": "http.response.body",
-        "body": b"first chunk ",
-        "more_body": True,
-    }
-    assert (await instance.receive_output(1)) == {
-        "type": "http.response.body",
-        "body": b"second chunk",
-        "more_body": True,
-    }
-    assert (await instance.receive_output(1)) == {"type": "http.response.body"}
+    assert (await receive_all(instance, 4)) == [
+        {
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [(b"x-colour", b"Blue")],
+        },
+        {
+            "type": "http.response.body",
+            "body": b"first chunk ",
+            "more_body": True,
+        },
+        {
+            "type": "http.response.body",
+            "body": b"second chunk",
+            "more_body": True,
+        },
+        {"type": "http.response.body"},
+    ]
 
 
-@pytest.mark.asyncio
 async def test_wsgi_path_encoding():
     """
     Makes sure the WSGI wrapper has basic functionality.
@@ -84,111 +95,84 @@ async def test_wsgi_path_encoding():
     )
     await instance.send_input({"type": "http.request"})
     # Check they send stuff
-    assert (await instance.receive_output(1)) == {
+    assert (await instance.receive_output(TIMEOUT)) == {
         "type": "http.response.start",
         "status": 200,
         "headers": [],
     }
-    assert (await instance.receive_output(1)) == {
+    assert (await instance.receive_output(TIMEOUT)) == {
         "type": "http.response.body",
         "body": b"",
         "more_body": True,
     }
-    assert (await instance.receive_output(1)) == {"type": "http.response.body"}
+    assert (await instance.receive_output(TIMEOUT)) == {"type": "http.response.body"}
 
 
-@pytest.mark.asyncio
-async def test_wsgi_empty_body():
-    """
-    Makes sure WsgiToAsgi handles an empty body response correctly
-    """
-
-    def wsgi_application(environ, start_response):
-        start_response("200 OK", [])
-        return []
-
-    application = WsgiToAsgi(wsgi_application)
-    instance = ApplicationCommunicator(
-        application,
-        {
-            "type": "http",
-            "http_version": "1.0",
-            "method": "GET",
-            "path": "/",
-            "query_string": b"",
-            "headers": [],
-        },
-    )
-    await instance.send_input({"type": "http.request"})
-
-    # response.start should always be send
-    assert (await instance.receive_output(1)) == {
-        "type": "http.response.start",
-        "status": 200,
-        "headers": [],
-    }
-
-    assert (await instance.receive_output(1)) == {"type": "http.response.body"}
+# Body-handling WSGI applications, defined at module level so the
+# parametrised test below can wrap each one just once.
+def wsgi_app_empty_body(environ, start_response):
+    start_response("200 OK", [])
+    return []
 
 
-@pytest.mark.asyncio
-async def test_wsgi_clamped_body():
-    """
-    Makes sure WsgiToAsgi clamps a body response longer than Content-Length
-    """
+def wsgi_app_clamped_body(environ, start_response):
+    start_response("200 OK", [("Content-Length", "8")])
+    return [b"0123", b"45", b"6789"]
 
-    def wsgi_application(environ, start_response):
-        start_response("200 OK", [("Content-Length", "8")])
-        return [b"0123", b"45", b"6789"]
 
-    application = WsgiToAsgi(wsgi_application)
-    instance = ApplicationCommunicator(
-        application,
-        {
-            "type": "http",
-            "http_version": "1.0",
-            "method": "GET",
-            "path": "/",
-            "query_string": b"",
-            "headers": [],
-        },
-    )
-    await instance.send_input({"type": "http.request"})
-    assert (await instance.receive_output(1)) == {
-        "type": "http.response.start",
-        "status": 200,
-        "headers": [(b"content-length", b"8")],
-    }
-    assert (await instance.receive_output(1)) == {
-        "type": "http.response.body",
-        "body": b"0123",
-        "more_body": True,
-    }
-    assert (await instance.receive_output(1)) == {
-        "type": "http.response.body",
-        "body": b"45",
-        "more_body": True,
-    }
-    assert (await instance.receive_output(1)) == {
-        "type": "http.response.body",
-        "body": b"67",
-        "more_body": True,
-    }
-    assert (await instance.receive_output(1)) == {"type": "http.response.body"}
+def wsgi_app_iterates_past_content_length(environ, start_response):
+    start_response("200 OK", [("Content-Length", "4")])
+    yield b"0123"
+    pytest.fail("WsgiToAsgi should not iterate after Content-Length bytes")
+    yield b"4567"
 
 
-@pytest.mark.asyncio
-async def test_wsgi_stops_iterating_after_content_length_bytes():
+@pytest.mark.parametrize(
+    "wsgi_application,expected_output",
+    [
+        # response.start should always be sent, even for an empty body
+        (
+            wsgi_app_empty_body,
+            [
+                {"type": "http.response.start", "status": 200, "headers": []},
+                {"type": "http.response.body"},
+            ],
+        ),
+        # A body response longer than Content-Length is clamped
+        (
+            wsgi_app_clamped_body,
+            [
+                {
+                    "type": "http.response.start",
+                    "status": 200,
+                    "headers": [(b"content-length", b"8")],
+                },
+                {"type": "http.response.body", "body": b"0123", "more_body": True},
+                {"type": "http.response.body", "body": b"45", "more_body": True},
+                {"type": "http.response.body", "body": b"67", "more_body": True},
+                {"type": "http.response.body"},
+            ],
+        ),
+        # The application is not iterated past Content-Length bytes
+        (
+            wsgi_app_iterates_past_content_length,
+            [
+                {
+                    "type": "http.response.start",
+                    "status": 200,
+                    "headers": [(b"content-length", b"4")],
+                },
+                {"type": "http.response.body", "body": b"0123", "more_body": True},
+                {"type": "http.response.body"},
+            ],
+        ),
+    ],
+)
+async def test_wsgi_body_handling(wsgi_application, expected_output):
     """
-    Makes sure WsgiToAsgi does not iterate after than Content-Length bytes
+    Makes sure WsgiToAsgi handles empty, clamped and over-long bodies
+    correctly with respect to Content-Length.
     """
-
-    def wsgi_application(environ, start_response):
-        start_response("200 OK", [("Content-Length", "4")])
-        yield b"0123"
-        pytest.fail("WsgiToAsgi should not iterate after Content-Length bytes")
-        yield b"4567"
-
     application = WsgiToAsgi(wsgi_application)
     instance = ApplicationCommunicator(
         application,
@@ -202,20 +186,9 @@ async def test_wsgi_stops_iterating_after_content_length_bytes():
         },
     )
     await instance.send_input({"type": "http.request"})
-    assert (await instance.receive_output(1)) == {
-        "type": "http.response.start",
-        "status": 200,
-        "headers": [(b"content-length", b"4")],
-    }
-    assert (await instance.receive_output(1)) == {
-        "type": "http.response.body",
-        "body": b"0123",
-        "more_body": True,
-    }
-    assert (await instance.receive_output(1)) == {"type": "http.response.body"}
+    assert (await receive_all(instance, len(expected_output))) == expected_output
 
 
-@pytest.mark.asyncio
 async def test_wsgi_multiple_start_response():
     """
     Makes sure WsgiToAsgi only keep Content-Length from the last call to start_response
@@ -242,20 +215,19 @@ async def test_wsgi_multiple_start_response():
         },
     )
     await instance.send_input({"type": "http.request"})
-    assert (await instance.receive_output(1)) == {
+    assert (await instance.receive_output(TIMEOUT)) == {
         "type": "http.response.start",
         "status": 500,
         "headers": [],
     }
-    assert (await instance.receive_output(1)) == {
+    assert (await instance.receive_output(TIMEOUT)) == {
         "type": "http.response.body",
         "body": b"Some long error message",
         "more_body": True,
     }
-    assert (await instance.receive_output(1)) == {"type": "http.response.body"}
+    assert (await instance.receive_output(TIMEOUT)) == {"type": "http.response.body"}
 
 
-@pytest.mark.asyncio
 async def test_wsgi_multi_body():
     """
     Verify that multiple http.request events with body parts are all delivered
@@ -286,10 +258,10 @@ async def test_wsgi_multi_body():
     )
     await instance.send_input({"type": "http.request", "body": b"World!"})
 
-    assert (await instance.receive_output(1)) == {
+    assert (await instance.receive_output(TIMEOUT)) == {
         "type": "http.response.start",
         "status": 200,
         "headers": [],
     }
 
-    assert (await instance.receive_output(1)) == {"type": "http.response.body"}
+    assert (await instance.receive_output(TIMEOUT)) == {"type": "http.response.body"}